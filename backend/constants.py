@@ -26,6 +26,9 @@ POSTCODE_TO_STATE = {
     "9": "ACT",
 }
 
+# Same mapping indexed directly by the postcode's first digit (0-9)
+POSTCODE_TO_STATE_ARR = tuple(POSTCODE_TO_STATE.get(str(digit), "Unknown") for digit in range(10))
+
 STREET_TYPES = [
     "Street", "St", "Road", "Rd", "Avenue", "Ave", "Drive", "Dr",
     "Boulevard", "Blvd", "Lane", "Ln", "Terrace", "Terr", "Place",
@@ -40,4 +43,14 @@ OCR_CONFIGS = {
             "given_names": 6,
             "surname": 6,
             "sex": 10,
-        }
\ No newline at end of file
+        }
+
+# Blank-field check before OCR. These are deliberately conservative rather than
+# calibrated: a region is only skipped when no pixel in it is darker than
+# INK_THRESHOLD, so faint or thin handwriting is still sent to Tesseract.
+
+# Grayscale level below which a pixel counts as ink
+INK_THRESHOLD = 200
+
+# Minimum ink pixels a field region needs before it is worth running OCR on
+MIN_INK_PIXELS = 1
@@ -125,8 +125,11 @@ class ProtocolExecutor:
                 }
                 self.execute_protocol(data)
 
-                local_record = session.merge(record)
-                session.delete(local_record)
+                # Delete by primary key in one statement rather than merging the detached
+                # record back into the session (a SELECT) and then deleting it
+                session.query(PatientRecord).filter(
+                    PatientRecord.id == record.id
+                ).delete(synchronize_session=False)
                 session.commit()
 
 
@@ -1,6 +1,7 @@
 # database.py
 
 import logging
+from functools import lru_cache
 from sqlalchemy import create_engine, Column, Integer, String, DateTime, Float, Boolean, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -36,6 +37,21 @@ class PatientRecord(Base):
     image_path = Column(String)
 
 
+@lru_cache(maxsize=None)
+def _get_engine(db_url: str):
+    """
+    Returns the engine for a database URL, creating it (and the tables) only once per process.
+    Every page and the protocol executor build their own DatabaseManager, so without this
+    each one would open a separate connection pool and re-run create_all.
+    """
+    # Log the database URI being used
+    logging.info(f"Using database at: {db_url}")
+
+    engine = create_engine(db_url, echo=False)
+    Base.metadata.create_all(engine)
+    return engine
+
+
 class DatabaseManager:
     def __init__(self, db_url=None):
         """
@@ -48,11 +64,7 @@ class DatabaseManager:
         if not db_url:
             db_url = 'sqlite:///pathology_records.db'
         
-        # Log the database URI being used
-        logging.info(f"Using database at: {db_url}")
-        
-        self.engine = create_engine(db_url, echo=False)
-        Base.metadata.create_all(self.engine)
+        self.engine = _get_engine(db_url)
         self.Session = sessionmaker(bind=self.engine)
     
     def add_record(self, patient_info, validation_errors, ocr_confidence=None):
@@ -209,24 +221,29 @@ class DatabaseManager:
         """
         session = self.Session()
         try:
-            flagged_records = session.query(PatientRecord).filter(
+            # Select only the columns the review list needs instead of hydrating full ORM objects
+            flagged_rows = session.query(
+                PatientRecord.id,
+                PatientRecord.request_number,
+                PatientRecord.given_names,
+                PatientRecord.surname,
+                PatientRecord.error_details
+            ).filter(
                 PatientRecord.needs_manual_review == True
             ).all()
 
-            # Convert records to dictionaries
-            flagged_entries = []
-            for record in flagged_records:
-                entry = {
-                    'id': record.id,
-                    'request_number': record.request_number,
-                    'given_names': record.given_names,
-                    'surname': record.surname,
-                    'validation_errors': record.error_details,
+            # Convert rows to dictionaries
+            return [
+                {
+                    'id': record_id,
+                    'request_number': request_number,
+                    'given_names': given_names,
+                    'surname': surname,
+                    'validation_errors': error_details,
                     # Add other fields as needed
                 }
-                flagged_entries.append(entry)
-
-            return flagged_entries
+                for record_id, request_number, given_names, surname, error_details in flagged_rows
+            ]
         except Exception as e:
             logging.error(f"Error fetching flagged entries: {e}")
             raise
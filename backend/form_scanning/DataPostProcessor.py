@@ -1,7 +1,85 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
 import re
-from backend.constants import ALLOWED_CHARACTERS, COMMON_MISREADS, POSTCODE_TO_STATE, STREET_TYPES
+from backend.constants import ALLOWED_CHARACTERS, COMMON_MISREADS, POSTCODE_TO_STATE_ARR, STREET_TYPES
+from backend.utils import parse_dmy_date
+
+# Lowercased street types for O(1) membership tests
+STREET_TYPES_SET = frozenset(s.lower() for s in STREET_TYPES)
+_STRIP_CHARS = ",."
+
+
+class _CharacterFilter:
+    """
+    Deletes every character matching a single-character pattern. ASCII text (the
+    usual Tesseract output) goes through a prebuilt str.translate table in one C-level
+    pass; anything else falls back to the compiled pattern.
+    """
+    __slots__ = ("pattern", "ascii_table")
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = re.compile(pattern)
+        self.ascii_table = {c: None if self.pattern.fullmatch(chr(c)) else c for c in range(128)}
+
+    def apply(self, text: str) -> str:
+        if text.isascii():
+            return text.translate(self.ascii_table)
+        return self.pattern.sub('', text)
+
+
+# Per-field misread corrections as single-pass translate tables
+_MISREAD_TABLES = {field: str.maketrans(mapping) for field, mapping in COMMON_MISREADS.items()}
+
+# Per-field whitelists and cleanup filters, built once at import
+_WHITELIST_FILTERS = {field: _CharacterFilter(pattern) for field, pattern in ALLOWED_CHARACTERS.items()}
+_NON_DIGIT_FILTER = _CharacterFilter(r'\D')
+_NAME_FILTER = _CharacterFilter(r'[^A-Za-z\s\-\'\.]')
+
+# Precompiled patterns for the per-field cleanup
+_RE_WS = re.compile(r'\s+')
+_RE_24H = re.compile(r'24H\d{5}')
+_RE_POSTCODE = re.compile(r'(\d{4})$')
+
+# Address camel-case split: every capital gains a leading space, which the whitespace
+# collapse then merges or trims, so no zero-width regex is needed
+_UPPER_SPACE_TABLE = {c: ' ' + chr(c) for c in range(ord('A'), ord('Z') + 1)}
+
+# Every digit run with its optional (H)/(M) label; the label group is empty when absent
+_RE_PHONE_RUN = re.compile(r'(\d+)(?:\((H|M)\))?')
+
+
+@lru_cache(maxsize=2048)
+def _clean_text_cached(field_name: str, text: str) -> str:
+    """
+    Field-specific cleanup behind DataPostProcessor.clean_text. Batches of forms
+    repeat the same short OCR strings, so results are memoised per (field, text).
+    """
+    table = _MISREAD_TABLES.get(field_name)
+    if table:
+        text = text.translate(table)
+
+    if field_name in _WHITELIST_FILTERS:
+        # Apply character whitelist
+        text = _WHITELIST_FILTERS[field_name].apply(text)
+
+    # Additional field-specific cleaning. The medicare_number and request_number
+    # whitelists already drop whitespace, so no separate whitespace pass is needed.
+    if field_name in ["home_phone", "mobile_phone"]:
+        text = _NON_DIGIT_FILTER.apply(text)
+    elif field_name == "address":
+        # Split camel-cased words, then collapse whitespace with C-level split/join
+        text = ' '.join(text.translate(_UPPER_SPACE_TABLE).split())
+    elif field_name == "request_number":
+        match = _RE_24H.search(text)
+        if match:
+            text = match.group(0)
+    elif field_name in ["given_names", "surname", "name"]:
+        # Allow letters, spaces, and common punctuation in names
+        text = _RE_WS.sub(' ', _NAME_FILTER.apply(text)).strip()
+
+    return text.strip()
+
 
 class DataPostProcessor:
     def __init__(self, debug_mode: bool = False) -> None:
@@ -18,50 +96,11 @@ class DataPostProcessor:
         Returns:
             str: The cleaned text.
         """
-        text = self._correct_misreadings(field_name, text)
-
-        # Apply character whitelist
-        if field_name in ALLOWED_CHARACTERS:
-            pattern = ALLOWED_CHARACTERS[field_name]
-            text = re.sub(pattern, '', text)
-
-        # Additional field-specific cleaning
-        if field_name == "medicare_number":
-            text = re.sub(r'\s+', '', text)
-        elif field_name in ["home_phone", "mobile_phone"]:
-            text = re.sub(r'\D+', '', text)
-        elif field_name == "address":
-            text = re.sub(r'(?<!^)(?=[A-Z])', ' ', text)
-            text = re.sub(r'\s+', ' ', text).strip()
-        elif field_name == "request_number":
-            text = re.sub(r'\s+', '', text)
-            match = re.search(r'24H\d{5}', text)
-            if match:
-                text = match.group(0)
-        elif field_name in ["given_names", "surname", "name"]:
-            # Allow letters, spaces, and common punctuation in names
-            text = re.sub(r'[^A-Za-z\s\-\'\.]', '', text)
-            text = re.sub(r'\s+', ' ', text).strip()
+        text = _clean_text_cached(field_name, text)
 
         if self.debug_mode:
             print(f"Cleaned text for field '{field_name}': '{text}'")
 
-        return text.strip()
-
-    def _correct_misreadings(self, field_name: str, text: str) -> str:
-        """
-        Corrects common OCR misreadings based on field-specific rules.
-
-        Args:
-            field_name (str): The name of the field.
-            text (str): The text to correct.
-
-        Returns:
-            str: The corrected text.
-        """
-        misreads = COMMON_MISREADS.get(field_name, {})
-        for wrong_char, correct_char in misreads.items():
-            text = text.replace(wrong_char, correct_char)
         return text
 
     def split_address(self, full_address: str) -> Dict[str, Optional[str]]:
@@ -76,14 +115,21 @@ class DataPostProcessor:
         """
         address_components = {"address": None, "suburb": None, "postcode": None, "state": None}
 
-        # Extract postcode (assumed to be the last 4 digits)
-        match = re.search(r'(\d{4})$', full_address.strip())
+        # Nothing to split on empty or whitespace-only input
+        if not full_address or full_address.isspace():
+            address_components["address"] = full_address
+            return address_components
+
+        # Extract postcode (assumed to be the last 4 digits). Only trailing whitespace
+        # matters here, and rstrip keeps match offsets aligned with full_address.
+        match = _RE_POSTCODE.search(full_address.rstrip())
         if match:
             postcode = match.group(1)
             address_components["postcode"] = postcode
             full_address = full_address[:match.start()].strip()
 
-            state = POSTCODE_TO_STATE.get(postcode[0], "Unknown")
+            digit = ord(postcode[0]) - 48
+            state = POSTCODE_TO_STATE_ARR[digit] if 0 <= digit <= 9 else "Unknown"
             address_components["state"] = state
 
         # Tokenize the address
@@ -111,8 +157,7 @@ class DataPostProcessor:
             Optional[int]: Index of the street type or None if not found.
         """
         for i, token in enumerate(tokens):
-            clean_token = token.strip(",.").capitalize()
-            if clean_token in STREET_TYPES:
+            if token.strip(_STRIP_CHARS).lower() in STREET_TYPES_SET:
                 return i
         return None
 
@@ -126,14 +171,14 @@ class DataPostProcessor:
         Returns:
             Optional[datetime]: The parsed datetime object or None if invalid.
         """
-        try:
-            return datetime.strptime(date_str, '%d/%m/%Y')
-        except ValueError:
-            return None
+        return parse_dmy_date(date_str)
 
-    def process_phone_numbers(self, phone_field: str) -> Dict[str, Optional[str]]:
+    def split_phone_numbers(self, phone_field: str) -> Dict[str, Optional[str]]:
         """
-        Processes the 'phone_number' field to extract Home and Mobile phone numbers.
+        Splits a whitespace-free phone field into Home and Mobile numbers in one regex pass.
+        Labelled numbers are assigned by their label. Without any labels, a single number is
+        treated as mobile if it starts with '04' and home otherwise, and two numbers are
+        taken as mobile then home.
 
         Args:
             phone_field (str): The concatenated phone number field.
@@ -146,14 +191,26 @@ class DataPostProcessor:
         if not phone_field:
             return phone_numbers
 
-        # Use regex to find all phone numbers and their labels
-        phone_matches = re.findall(r'(\d+)\((H|M)\)', phone_field)
-
-        for number, label in phone_matches:
-            number = re.sub(r'[^\d+]', '', number).strip()
-            if label.upper() == 'H':
+        labelled = False
+        unlabelled = []
+        for number, label in _RE_PHONE_RUN.findall(phone_field):
+            if label == 'H':
                 phone_numbers["home_phone"] = number
-            elif label.upper() == 'M':
+                labelled = True
+            elif label == 'M':
                 phone_numbers["mobile_phone"] = number
+                labelled = True
+            else:
+                unlabelled.append(number)
+
+        if labelled:
+            return phone_numbers
+
+        if len(unlabelled) == 1:
+            key = "mobile_phone" if unlabelled[0].startswith("04") else "home_phone"
+            phone_numbers[key] = unlabelled[0]
+        elif len(unlabelled) == 2:
+            phone_numbers["mobile_phone"], phone_numbers["home_phone"] = unlabelled
+        # If more than 2 or none, no numbers are assigned
 
         return phone_numbers
@@ -1,12 +1,14 @@
 from typing import Dict, Tuple, Optional, Any
+import logging
 import numpy as np
 import cv2
 from backend.form_scanning.TextProcessor import TextProcessor
-from backend.constants import OCR_CONFIGS
+from backend.constants import OCR_CONFIGS, MIN_INK_PIXELS, INK_THRESHOLD
 from backend.form_scanning.RequestFormProcessor import FieldData
 
 class FieldExtractor:
-    def __init__(self, form_image: np.ndarray, config: dict, debug_mode: bool = False) -> None:
+    def __init__(self, form_image: np.ndarray, config: dict, debug_mode: bool = False,
+                 text_processor: Optional[TextProcessor] = None) -> None:
         """
         Initializes the FieldExtractor with the form image and configuration.
         
@@ -14,29 +16,39 @@ class FieldExtractor:
             form_image (np.ndarray): The preprocessed form image.
             config (dict): Configuration for field regions.
             debug_mode (bool): Enable debug mode for visualizations.
+            text_processor (TextProcessor, optional): Shared OCR processor to reuse across forms.
         """
         self.form_image = form_image
         self.config = config
         self.debug_mode = debug_mode
-        self.text_processor = TextProcessor()
-        extractor = FieldExtractor(self.form_image, self.config, self.debug_mode)
+        self.text_processor = text_processor or TextProcessor()
 
     def extract_field_info(self, fields_dict: Dict[str, Any]) -> Dict[str, Any]:
         extracted_fields = {}
+        pending_fields = []
+        ocr_requests = []
         for field_name, extracted_field in fields_dict.items():
             # Extract bounding box from the ExtractedField
             bounding_box = extracted_field.bounding_box
             x1, y1, x2, y2 = bounding_box
+
+            # Skip Tesseract entirely on blank regions (e.g. unfilled optional fields)
+            if self._is_blank_region((x1, y1, x2, y2)):
+                logging.debug(f"Skipping OCR for blank field region: {field_name}")
+                extracted_fields[field_name] = FieldData(value=None, confidence=0.0, bounding_box=bounding_box)
+                continue
+
             masked_image = self._create_masked_image((x1, y1, x2, y2))
 
             # Get OCR configuration for the field
             ocr_config = self.config["ocr_configs"].get(field_name, self.config["ocr_configs"]["default"])
-            field_value, confidence = self.text_processor.extract_text(
-                masked_image,
-                lang=ocr_config["lang"],
-                psm=ocr_config["psm"]
-            )
+            extracted_fields[field_name] = None  # Keep field order; filled in after the batch
+            pending_fields.append((field_name, bounding_box))
+            ocr_requests.append((masked_image, ocr_config["lang"], ocr_config["psm"]))
 
+        # OCR all non-blank fields in a single batch
+        ocr_results = self.text_processor.extract_text_batch(ocr_requests)
+        for (field_name, bounding_box), (field_value, confidence) in zip(pending_fields, ocr_results):
             # Store FieldData instance
             extracted_fields[field_name] = FieldData(
                 value=field_value.strip() if field_value else None,
@@ -45,6 +57,25 @@ class FieldExtractor:
             )
         return extracted_fields
 
+    def _is_blank_region(self, region: Tuple[int, int, int, int]) -> bool:
+        """
+        Checks whether a region contains too little ink to be worth running OCR on.
+
+        Args:
+            region (Tuple[int, int, int, int]): Region coordinates (x1, y1, x2, y2).
+
+        Returns:
+            bool: True if the region has no ink at all.
+        """
+        x1, y1, x2, y2 = region
+        roi = self.form_image[y1:y2, x1:x2]
+        if roi.size == 0:
+            return True
+        if roi.ndim == 3:
+            roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+        dark_pixels = np.count_nonzero(roi < INK_THRESHOLD)
+        return dark_pixels < MIN_INK_PIXELS
+
     def _create_masked_image(self, region: Tuple[int, int, int, int]) -> np.ndarray:
         """
         Creates a white mask over the entire image except for the specified region.
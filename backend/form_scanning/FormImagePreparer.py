@@ -1,20 +1,22 @@
 import cv2
+import logging
 import numpy as np
-from typing import Tuple
+from typing import Tuple, Union
 from dataclasses import dataclass
 
 class FormImagePreparer:
     def __init__(self, debug_mode: bool = False) -> None:
         pass
 
-    def _load_image(self, image_path: str) -> np.ndarray:
+    def load_image(self, image_path: str) -> np.ndarray:
         image = cv2.imread(image_path)
         if image is None:
             raise FileNotFoundError(f"Could not load image at {image_path}")
         return image
 
-    def prepare_form(self, file_path, target_size: Tuple[int, int] = (1024, 768)) -> np.ndarray:
-        img = self._load_image(file_path)
+    def prepare_form(self, image: Union[np.ndarray, str], target_size: Tuple[int, int] = (1024, 768)) -> np.ndarray:
+        # Accept an already decoded image so callers can decode once and reuse it
+        img = image if isinstance(image, np.ndarray) else self.load_image(image)
 
         cropped_image = self.crop_to_content(img)
         prepared_image = self.scale_image(cropped_image, target_size)        
@@ -42,7 +44,7 @@ class FormImagePreparer:
         
         if not contours:
             # If no contours are found, return the original image
-            print("No significant contours found. Returning original image.")
+            logging.debug("No significant contours found. Returning original image.")
             return image
 
         # Compute the bounding rectangle for all contours
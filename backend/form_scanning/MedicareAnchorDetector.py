@@ -5,6 +5,10 @@ import re
 import numpy as np
 from backend.form_scanning.TextProcessor import TextProcessor
 
+# Precompiled cleanup patterns for OCR'd Medicare candidates
+_RE_NON_MEDICARE_CHARS = re.compile(r"[^0-9/\s]")
+_RE_WS = re.compile(r"\s+")
+
 @dataclass
 class MedicareAnchor:
     """
@@ -91,6 +95,9 @@ class MedicareAnchorDetector:
 
         highest_conf_match = None
 
+        # Compile the (user-configurable) pattern once per search rather than per candidate
+        medicare_regex = re.compile(self.medicare_pattern)
+
         # 5. Iterate all recognized words
         for i, word in enumerate(texts):
             # Basic sanity checks
@@ -110,7 +117,7 @@ class MedicareAnchorDetector:
             # Remove or fix known noise, e.g. stray punctuation except digits, slash, or spaces
             # (We keep slash so we can do slash-checks. We keep digits. We allow spaces, then trim later.)
             # Because Tesseract can inject artifacts, we can remove e.g. alpha letters or random punctuation:
-            pre_clean = re.sub(r"[^0-9/\s]", "", original_word)
+            pre_clean = _RE_NON_MEDICARE_CHARS.sub("", original_word)
 
             # Trim excessive whitespace
             pre_clean = pre_clean.strip()
@@ -122,8 +129,8 @@ class MedicareAnchorDetector:
             matched_text = None
             for candidate in corrected_candidates:
                 # Remove intermediate spaces before final pattern match
-                candidate_no_space = re.sub(r"\s+", "", candidate)
-                if re.match(self.medicare_pattern, candidate_no_space):
+                candidate_no_space = _RE_WS.sub("", candidate)
+                if medicare_regex.match(candidate_no_space):
                     matched_text = candidate_no_space
                     break
 
@@ -3,17 +3,20 @@ from dataclasses import dataclass, fields
 import logging
 import cv2
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from backend.form_scanning.FormImagePreparer import FormImagePreparer
 from backend.form_scanning.FieldExtractor import FieldExtractor
 from backend.form_scanning.DataPostProcessor import DataPostProcessor
 from backend.form_scanning.Validator import Validator
 from backend.database.database import DatabaseManager
 from backend.form_scanning.MedicareAnchorDetector import MedicareDetector
+from backend.form_scanning.TextProcessor import TextProcessor
 from backend.constants import OCR_CONFIGS
 from pyzbar.pyzbar import decode
 
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 import re
 import os
 import json
@@ -21,8 +24,15 @@ import torch
 from detectron2.config import get_cfg
 from detectron2.engine import DefaultPredictor
 
+# Precompiled patterns used in derived-field post-processing
+_RE_PROVIDER_DISALLOWED = re.compile(r'[^A-Z0-9]')
+_RE_WS = re.compile(r'\s+')
+
 @dataclass
 class FieldData:
+    # One instance per field per form; slots drop the per-instance __dict__
+    __slots__ = ("value", "confidence", "bounding_box")
+
     value: Optional[str]
     confidence: Optional[int]
     bounding_box: Optional[Tuple[int, int, int, int]]
@@ -48,6 +58,26 @@ class ProcessedForm:
     provider_number: Optional[FieldData] = None
     sex: Optional[FieldData] = None  
 
+# (ProcessedForm attribute, self.information key) pairs used to build the result
+_PROCESSED_FORM_FIELDS = (
+    ("request_number", "request_number"),
+    ("request_date", "request_date"),
+    ("received_date", "received_date"),
+    ("surname", "surname"),
+    ("given_name", "given_names"),
+    ("address", "address"),
+    ("suburb", "suburb"),
+    ("postcode", "postcode"),
+    ("state", "state"),
+    ("date_of_birth", "date_of_birth"),
+    ("mobile_phone", "mobile_phone"),
+    ("home_phone", "home_phone"),
+    ("medicare_number", "medicare_number"),
+    ("medicare_position", "medicare_position"),
+    ("provider_number", "provider_number"),
+    ("sex", "sex"),
+)
+
 class ModelManager:
     """Singleton class to manage the model instance and configuration."""
     _instance = None
@@ -95,34 +125,34 @@ class BatchRequestFormProcessor:
         # Initialize components that can be shared across forms
         self.data_post_processor = DataPostProcessor(debug_mode)
         self.validator = Validator()
+        self.text_processor = TextProcessor()
 
     def process_batch(self, image_paths: List[str], batch_size: int = 4) -> Dict[str, Dict]:
         """Process multiple forms in batches."""
         results = {}
         
-        # Process images in batches
-        for i in range(0, len(image_paths), batch_size):
-            batch_paths = image_paths[i:i + batch_size]
-            batch_results = self._process_batch(batch_paths)
-            results.update(batch_results)
+        # One loader thread for the whole run, so the next form is prefetched across
+        # batch boundaries as well as within a batch
+        with ThreadPoolExecutor(max_workers=1) as loader:
+            forms = self._prepare_images(image_paths, loader)
+            
+            # Process images in batches
+            for _ in range(0, len(image_paths), batch_size):
+                batch_results = self._process_batch(islice(forms, batch_size))
+                results.update(batch_results)
         
         return results
 
-    def _process_batch(self, image_paths: List[str]) -> Dict[str, Dict]:
+    def _process_batch(self, forms: Iterable[Tuple[str, np.ndarray, np.ndarray]]) -> Dict[str, Dict]:
         """Process a single batch of forms."""
         predictor, cfg = self.model_manager.get_predictor()
         batch_results = {}
         
-        # Prepare all images in batch
-        prepared_images = []
-        for path in image_paths:
-            form_preparer = FormImagePreparer(self.debug_mode)
-            form_preparer.image_path = path
-            prepared_images.append((path, form_preparer.prepare_form()))
-        
-        # Extract fields for all images in batch
+        # Extract fields for all images in batch. Each image is decoded and prepared
+        # just before it is needed, so at most the current form and the one being
+        # prefetched are held in memory at a time.
         with torch.no_grad():
-            for path, prepared_image in prepared_images:
+            for path, image, prepared_image in forms:
                 processor = SingleFormProcessor(
                     path,
                     prepared_image,
@@ -131,13 +161,29 @@ class BatchRequestFormProcessor:
                     self.field_config,
                     self.data_post_processor,
                     self.validator,
-                    self.debug_mode
+                    self.debug_mode,
+                    original_image=image,
+                    text_processor=self.text_processor
                 )
                 result = processor.process_form()
                 batch_results[os.path.basename(path)] = result
         
         return batch_results
 
+    def _prepare_images(self, image_paths: List[str], loader: ThreadPoolExecutor) -> Iterator[Tuple[str, np.ndarray, np.ndarray]]:
+        """
+        Lazily decode and prepare each image. The next image is loaded on the loader
+        thread while the caller processes the current one, so file IO and decoding overlap OCR.
+        """
+        if not image_paths:
+            return
+        next_form = loader.submit(_load_and_prepare_path, image_paths[0])
+        for index, path in enumerate(image_paths):
+            image, prepared_image = next_form.result()
+            if index + 1 < len(image_paths):
+                next_form = loader.submit(_load_and_prepare_path, image_paths[index + 1])
+            yield path, image, prepared_image
+
 class SingleFormProcessor:
     """Processes a single form using shared resources."""
     def __init__(
@@ -149,15 +195,19 @@ class SingleFormProcessor:
         field_config: dict,
         data_post_processor: DataPostProcessor,
         validator: Validator,
-        debug_mode: bool = False
+        debug_mode: bool = False,
+        original_image: Optional[np.ndarray] = None,
+        text_processor: Optional[TextProcessor] = None
     ):
         self.image_path = image_path
+        self.original_image = original_image
         self.prepared_image = prepared_image
         self.predictor = predictor
         self.cfg = cfg
         self.field_config = field_config
         self.data_post_processor = data_post_processor
         self.validator = validator
+        self.text_processor = text_processor
         self.debug_mode = debug_mode
         
         self.information = {
@@ -186,7 +236,7 @@ class SingleFormProcessor:
         """Process a single form using the shared predictor."""
         try:
             # Extract fields using the shared predictor
-            field_extractor = FieldExtractor(self.prepared_image, self.field_config, self.debug_mode)
+            field_extractor = FieldExtractor(self.prepared_image, self.field_config, self.debug_mode, self.text_processor)
             extracted_fields = field_extractor.extract_field_info(self.predictor)
             
             # Map extracted fields
@@ -195,8 +245,8 @@ class SingleFormProcessor:
             # Post-process fields
             self._post_process_derived_fields()
             
-            # Add request number from barcode
-            self._add_request_number(self.image_path)
+            # Add request number from barcode, reusing the decoded image if we have it
+            self._add_request_number(self.original_image if self.original_image is not None else self.image_path)
             
             # Set received date
             now_str = datetime.now().strftime('%d/%m/%Y')
@@ -223,96 +273,83 @@ class SingleFormProcessor:
         """
         Perform additional transformations using DataPostProcessor methods.
         """
+        info = self.information
+
         # --- Address Splitting ---
-        if self.information.get("address") and self.information["address"] and self.information["address"][0]:
-            full_address = self.information["address"][0]
+        # Skip the split when suburb, postcode and state were already extracted on their own
+        address_data = info.get("address")
+        components_present = all(info.get(key) and info[key][0] for key in ("suburb", "postcode", "state"))
+        if address_data and address_data[0] and not components_present:
+            full_address, addr_confidence, addr_bbox = address_data
             address_components = self.data_post_processor.split_address(full_address)
 
-            addr_confidence = self.information["address"][1]
-            addr_bbox = self.information["address"][2]
-
             if address_components["address"]:
-                self.information["address"] = (address_components["address"], addr_confidence, addr_bbox)
+                info["address"] = (address_components["address"], addr_confidence, addr_bbox)
             if address_components["suburb"]:
-                self.information["suburb"] = (address_components["suburb"], addr_confidence, addr_bbox)
+                info["suburb"] = (address_components["suburb"], addr_confidence, addr_bbox)
             if address_components["postcode"]:
-                self.information["postcode"] = (address_components["postcode"], addr_confidence, addr_bbox)
+                info["postcode"] = (address_components["postcode"], addr_confidence, addr_bbox)
             if address_components["state"]:
-                self.information["state"] = (address_components["state"], addr_confidence, addr_bbox)
+                info["state"] = (address_components["state"], addr_confidence, addr_bbox)
     
         # --- Medicare Number and Position ---
-        if self.information.get("medicare_number") and self.information["medicare_number"] and self.information["medicare_number"][0]:
-            medicare_full = self.information["medicare_number"][0]
-            med_confidence = self.information["medicare_number"][1]
-            med_bbox = self.information["medicare_number"][2]
+        medicare_data = info.get("medicare_number")
+        if medicare_data and medicare_data[0]:
+            medicare_full, med_confidence, med_bbox = medicare_data
 
             parts = medicare_full.split('/')
             if len(parts) == 2 and len(parts[0]) == 10 and len(parts[1]) == 1:
                 med_number = parts[0]
                 med_position = parts[1]
-                self.information["medicare_number"] = (med_number, med_confidence, med_bbox)
-                self.information["medicare_position"] = (med_position, med_confidence, med_bbox)
+                info["medicare_number"] = (med_number, med_confidence, med_bbox)
+                info["medicare_position"] = (med_position, med_confidence, med_bbox)
 
         # --- Provider Number ---
-        if ((not self.information.get("provider_number") or not self.information["provider_number"] or not self.information["provider_number"][0])
-            and self.information.get("doctor_information") and self.information["doctor_information"] and self.information["doctor_information"][0]):
+        provider_data = info.get("provider_number")
+        doctor_data = info.get("doctor_information")
+        if (not provider_data or not provider_data[0]) and doctor_data and doctor_data[0]:
             # Derive provider_number from doctor_information
-            doc_info_val = self.information["doctor_information"][0]
-            doc_conf = self.information["doctor_information"][1]
-            doc_bbox = self.information["doctor_information"][2]
-
-            provider_extracted = doc_info_val[-8:].upper()
-            provider_extracted = re.sub(r'[^A-Z0-9]', '', provider_extracted)
-            self.information["provider_number"] = (provider_extracted, doc_conf, doc_bbox)
-        else:
+            doc_info_val, doc_conf, doc_bbox = doctor_data
+
+            provider_extracted = self._clean_provider_number(doc_info_val)
+            info["provider_number"] = (provider_extracted, doc_conf, doc_bbox)
+        elif provider_data and provider_data[0]:
             # Provider number exists, clean it according to the rules
-            if self.information.get("provider_number") and self.information["provider_number"] and self.information["provider_number"][0]:
-                prov_val = self.information["provider_number"][0]
-                prov_conf = self.information["provider_number"][1]
-                prov_bbox = self.information["provider_number"][2]
+            prov_val, prov_conf, prov_bbox = provider_data
 
-                provider_extracted = prov_val[-8:].upper()
-                provider_extracted = re.sub(r'[^A-Z0-9]', '', provider_extracted)
-                self.information["provider_number"] = (provider_extracted, prov_conf, prov_bbox)
+            provider_extracted = self._clean_provider_number(prov_val)
+            info["provider_number"] = (provider_extracted, prov_conf, prov_bbox)
 
         # --- Phone Numbers ---
-        home_data = self.information.get("home_phone")
-        mobile_data = self.information.get("mobile_phone")
-        phone_data = self.information.get("phone_number")
+        home_data = info.get("home_phone")
+        mobile_data = info.get("mobile_phone")
+        phone_data = info.get("phone_number")
 
         if (not home_data or not home_data[0]) and (not mobile_data or not mobile_data[0]) and phone_data and phone_data[0]:
-            phone_str = phone_data[0]
-            ph_confidence = phone_data[1]
-            ph_bbox = phone_data[2]
-
-            # Normalize spaces
-            phone_str_no_spaces = re.sub(r'\s+', '', phone_str)  
-            phone_numbers = self.data_post_processor.process_phone_numbers(phone_str_no_spaces)
-
-            if phone_numbers["home_phone"] or phone_numbers["mobile_phone"]:
-                # Labeled numbers found
-                if phone_numbers["home_phone"]:
-                    self.information["home_phone"] = (phone_numbers["home_phone"], ph_confidence, ph_bbox)
-                if phone_numbers["mobile_phone"]:
-                    self.information["mobile_phone"] = (phone_numbers["mobile_phone"], ph_confidence, ph_bbox)
-            else:
-                # No labeled matches found, try unlabeled approach
-                single_numbers = re.findall(r'\d+', phone_str_no_spaces)
-                if len(single_numbers) == 1:
-                    # Single unlabeled number
-                    number = single_numbers[0]
-                    if number.startswith("04"):
-                        self.information["mobile_phone"] = (number, ph_confidence, ph_bbox)
-                    else:
-                        self.information["home_phone"] = (number, ph_confidence, ph_bbox)
-                elif len(single_numbers) == 2:
-                    # Two unlabeled numbers
-                    self.information["mobile_phone"] = (single_numbers[0], ph_confidence, ph_bbox)
-                    self.information["home_phone"] = (single_numbers[1], ph_confidence, ph_bbox)
-                # If more than 2 or none, no further action.
+            phone_str, ph_confidence, ph_bbox = phone_data
+
+            # Normalize spaces, then classify labelled or unlabelled numbers in one pass
+            phone_str_no_spaces = _RE_WS.sub('', phone_str)
+            phone_numbers = self.data_post_processor.split_phone_numbers(phone_str_no_spaces)
+
+            if phone_numbers["home_phone"]:
+                info["home_phone"] = (phone_numbers["home_phone"], ph_confidence, ph_bbox)
+            if phone_numbers["mobile_phone"]:
+                info["mobile_phone"] = (phone_numbers["mobile_phone"], ph_confidence, ph_bbox)
 
         # The received_date is overwritten in process_form to current time, so no need to parse it here.
 
+    @staticmethod
+    def _clean_provider_number(value: str) -> str:
+        """
+        Takes the last 8 characters of a value and keeps only upper-case letters and digits.
+        """
+        tail = value[-8:]
+        # Plain ASCII alphanumerics (the common case) need no regex pass
+        if tail.isascii() and tail.isalnum():
+            return tail.upper()
+        return _RE_PROVIDER_DISALLOWED.sub('', tail.upper())
+
     def _field_to_fielddata(self, field_name: str) -> Optional[FieldData]:
         """
         Converts a field from self.information to FieldData.
@@ -329,47 +366,31 @@ class SingleFormProcessor:
         """
         Create a ProcessedForm dataclass instance from self.information.
         """
-        return ProcessedForm(
-            image_path=self.image_path,
-            request_number=self._field_to_fielddata("request_number"),
-            request_date=self._field_to_fielddata("request_date"),
-            received_date=self._field_to_fielddata("received_date"),
-            surname=self._field_to_fielddata("surname"),
-            given_name=self._field_to_fielddata("given_names"),
-            address=self._field_to_fielddata("address"),
-            suburb=self._field_to_fielddata("suburb"),
-            postcode=self._field_to_fielddata("postcode"),
-            state=self._field_to_fielddata("state"),
-            date_of_birth=self._field_to_fielddata("date_of_birth"),
-            mobile_phone=self._field_to_fielddata("mobile_phone"),
-            home_phone=self._field_to_fielddata("home_phone"),
-            medicare_number=self._field_to_fielddata("medicare_number"),
-            medicare_position=self._field_to_fielddata("medicare_position"),
-            provider_number=self._field_to_fielddata("provider_number"),
-            sex=self._field_to_fielddata("sex")
-        )
-
-    def _add_request_number(self, image: str) -> List[str]:
+        form_fields = {attr: self._field_to_fielddata(key) for attr, key in _PROCESSED_FORM_FIELDS}
+        return ProcessedForm(image_path=self.image_path, **form_fields)
+
+    def _add_request_number(self, image: Union[np.ndarray, str]) -> List[str]:
         """
-        Function to read barcodes from an image.
+        Function to read barcodes from an image (decoded array or file path).
         """
-        img = cv2.imread(image)
+        # ZBar only reads luminance, so skip the colour decode when loading from disk
+        img = image if isinstance(image, np.ndarray) else cv2.imread(image, cv2.IMREAD_GRAYSCALE)
         detectedBarcodes = decode(img) 
         
         if not detectedBarcodes:
             return None
         
-        decoded_data = []
+        has_data = False
         for barcode in detectedBarcodes:
             if barcode.data:
-                decoded_data.append(barcode.data.decode('utf-8'))
-
-        if decoded_data:
-            for d in decoded_data:
+                has_data = True
+                d = barcode.data.decode('utf-8')
+                # Stop at the first valid request number
                 if self.validator.is_valid_request_number(d):
                     self.information["request_number"] = (d, 100, None)
                     break
-        else:
+
+        if not has_data:
             self.information["request_number"] = None
 
     def print_information(self) -> None:
@@ -380,17 +401,17 @@ class SingleFormProcessor:
             print(f"{key}: {value}")
 
     def get_ocr(self) -> float:
-        ocr = 0
-        
-        for i, field in enumerate(self.information):
-            if self.information[field] is not None:
-                ocr += self.information[field][1]
-                i += 1
-
-        ocr /= i + 1
-        return ocr
+        # Average only over fields that were actually filled in
+        confidences = [data[1] for data in self.information.values() if data is not None]
+        return sum(confidences) / len(confidences) if confidences else 0.0
 
 
 def load_field_config(config_path: str) -> dict:
     with open(config_path, 'r') as config_file:
         return json.load(config_file)
+
+def _load_and_prepare_path(image_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Decodes a form image and prepares it, returning (original, prepared)."""
+    form_preparer = FormImagePreparer()
+    image = form_preparer.load_image(image_path)
+    return image, form_preparer.prepare_form(image)
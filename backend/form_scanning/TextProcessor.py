@@ -1,18 +1,31 @@
+import os
 import re
 import pytesseract
 import cv2
 import numpy as np
-from typing import Any, Tuple 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+# Shared OCR pool so worker threads are reused across forms. Threads are only
+# started on first use, so importing this module stays cheap. Each worker runs its
+# own tesseract process, which may use several OpenMP threads itself, so the pool
+# uses half the cores to leave room for them rather than oversubscribing the CPU.
+_OCR_EXECUTOR = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) // 2), thread_name_prefix="ocr")
 
 class TextProcessor:
+    # Tesseract only needs verifying once per process, not once per instance
+    _tesseract_verified = False
+
     def __init__(self):
         self.ocr_result = None
         # Verify Tesseract is working
-        try:
-            pytesseract.get_tesseract_version()
-        except Exception as e:
-            print(f"Tesseract initialization error: {e}")
-            print("Please ensure Tesseract is properly installed")
+        if not TextProcessor._tesseract_verified:
+            try:
+                pytesseract.get_tesseract_version()
+                TextProcessor._tesseract_verified = True
+            except Exception as e:
+                print(f"Tesseract initialization error: {e}")
+                print("Please ensure Tesseract is properly installed")
             
     def extract_text(self, image: Any, lang: str = "eng", psm: int = 6, config: str = None) -> Tuple[str, float]:
         """
@@ -26,6 +39,31 @@ class TextProcessor:
         Returns:
             Tuple[str, float]: Extracted text and confidence score.
         """
+        self.ocr_result, text, confidence = self._run_ocr(image, lang, psm, config)
+        return text, confidence
+
+    def extract_text_batch(self, requests: List[Tuple[Any, str, int]]) -> List[Tuple[str, float]]:
+        """
+        Extracts text from several images in one call. Each image is OCR'd by its own
+        Tesseract process, so the calls run concurrently on the shared OCR thread pool.
+
+        Args:
+            requests (List[Tuple[Any, str, int]]): (image, lang, psm) for each image.
+
+        Returns:
+            List[Tuple[str, float]]: Extracted text and confidence score, in request order.
+        """
+        results = _OCR_EXECUTOR.map(lambda request: self._run_ocr(*request), requests)
+        return [(text, confidence) for _, text, confidence in results]
+
+    @staticmethod
+    def _run_ocr(image: Any, lang: str, psm: int, config: str = None) -> Tuple[Dict[str, list], str, float]:
+        """
+        Runs Tesseract on a single image without touching instance state, so it is safe to call from threads.
+
+        Returns:
+            Tuple[Dict[str, list], str, float]: Raw OCR data, extracted text and confidence score.
+        """
         # Prepare OCR configuration
         if config is None:
             custom_config = f"--psm {psm} -l {lang} --oem 3"
@@ -33,12 +71,14 @@ class TextProcessor:
             custom_config = f"{config} --psm {psm} -l {lang} --oem 3"
 
         # Perform OCR
-        self.ocr_result = pytesseract.image_to_data(image, config=custom_config, output_type=pytesseract.Output.DICT)
-        text = " ".join(self.ocr_result["text"]).strip()
-        confidences = [int(c) for c, t in zip(self.ocr_result["conf"], self.ocr_result["text"]) if t.strip() and int(c) >= 0]
+        ocr_result = pytesseract.image_to_data(image, config=custom_config, output_type=pytesseract.Output.DICT)
+        text = " ".join(ocr_result["text"]).strip()
+        # Convert each confidence once; word lists are short, so a comprehension beats a NumPy round-trip
+        confidences = [conf for c, t in zip(ocr_result["conf"], ocr_result["text"])
+                       if t and not t.isspace() and (conf := int(c)) >= 0]
         confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
-        return text, confidence
-            
+        return ocr_result, text, confidence
+
     def get_ocr_result(self):
         return self.ocr_result
\ No newline at end of file
@@ -1,5 +1,20 @@
-import re
 from datetime import datetime
+from functools import lru_cache
+from backend.utils import parse_dmy_date
+
+
+@lru_cache(maxsize=4096)
+def _is_parsable_date(date_str: str, date_format: str) -> bool:
+    # strptime is slow and batches repeat the same dates, so results are memoised
+    if date_format == '%d/%m/%Y':
+        # Fast path for the form's date format
+        return parse_dmy_date(date_str) is not None
+    try:
+        datetime.strptime(date_str, date_format)
+        return True
+    except ValueError:
+        return False
+
 
 class Validator:
     """
@@ -19,7 +34,7 @@ class Validator:
         """
         if medicare_number is None:
             return False
-        return bool(re.match(r'^\d{10}$', medicare_number))
+        return len(medicare_number) == 10 and medicare_number.isdecimal()
     
     @staticmethod
     def is_valid_medicare_position(medicare_position: str) -> bool:
@@ -34,7 +49,7 @@ class Validator:
         """
         if medicare_position is None:
             return False
-        return bool(re.match(r'^[1-9]$', medicare_position))
+        return len(medicare_position) == 1 and '1' <= medicare_position <= '9'
 
     @staticmethod
     def is_valid_phone_number(phone_number: str) -> bool:
@@ -50,7 +65,7 @@ class Validator:
         if phone_number is None:
             return False
     
-        return bool(re.match(r'^\d{10}$', phone_number))
+        return len(phone_number) == 10 and phone_number.isdecimal()
 
     @staticmethod
     def is_valid_request_number(request_number: str) -> bool:
@@ -65,7 +80,7 @@ class Validator:
         """
         if request_number is None:
             return False
-        return bool(re.match(r'^24H\d{5}$', request_number))
+        return len(request_number) == 8 and request_number.startswith('24H') and request_number[3:].isdecimal()
 
     @staticmethod
     def is_valid_provider_number(provider_number: str) -> bool:
@@ -80,7 +95,7 @@ class Validator:
         """
         if provider_number is None:
             return False
-        return bool(re.match(r'^[A-Za-z0-9]{8}$', provider_number))
+        return len(provider_number) == 8 and provider_number.isascii() and provider_number.isalnum()
 
     @staticmethod
     def is_valid_date(date_str: str, date_format: str = '%d/%m/%Y') -> bool:
@@ -96,11 +111,7 @@ class Validator:
         """
         if date_str is None:
             return False
-        try:
-            datetime.strptime(date_str, date_format)
-            return True
-        except ValueError:
-            return False
+        return _is_parsable_date(date_str, date_format)
 
     @staticmethod
     def validate_data(data: dict) -> dict:
@@ -123,28 +134,26 @@ class Validator:
                     errors[field] = f"OCR confidence for '{field}' is too low: {confidence}. Must be at least 70."
 
         # Field-specific validation logic
-        if "medicare_number" in data:
-            if data["medicare_number"] is None or not Validator.is_valid_medicare_number(data["medicare_number"][0]):
-                errors["medicare_number"] = "Invalid Medicare Number format."
+        for field, is_valid, message in _FIELD_VALIDATORS:
+            # One lookup per field; absent fields are skipped, present-but-None ones are errors
+            value = data.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            if value is None or not is_valid(value[0]):
+                errors[field] = message
 
-        if "mobile_phone" in data:
-            if data["mobile_phone"] is None or not Validator.is_valid_phone_number(data["mobile_phone"][0]):
-                errors["mobile_phone"] = "Invalid Mobile Phone Number format."
-
-        if "provider_number" in data:
-            if data["provider_number"] is None or not Validator.is_valid_provider_number(data["provider_number"][0]):
-                errors["provider_number"] = "Invalid Provider Number format."
-
-        if "date_of_birth" in data:
-            if data["date_of_birth"] is None or not Validator.is_valid_date(data["date_of_birth"][0]):
-                errors["date_of_birth"] = "Invalid Date of Birth format."
+        return errors
 
-        if "request_date" in data:
-            if data["request_date"] is None or not Validator.is_valid_date(data["request_date"][0]):
-                errors["request_date"] = "Invalid Request Date format."
 
-        if "medicare_position" in data:
-            if data["medicare_position"] is None or not Validator.is_valid_medicare_position(data["medicare_position"][0]):
-                errors["medicare_position"] = "Invalid Medicare Position format."
+# Sentinel distinguishing an absent field from one explicitly set to None
+_MISSING = object()
 
-        return errors
+# (field, predicate, error message) for the field-specific checks in validate_data
+_FIELD_VALIDATORS = (
+    ("medicare_number", Validator.is_valid_medicare_number, "Invalid Medicare Number format."),
+    ("mobile_phone", Validator.is_valid_phone_number, "Invalid Mobile Phone Number format."),
+    ("provider_number", Validator.is_valid_provider_number, "Invalid Provider Number format."),
+    ("date_of_birth", Validator.is_valid_date, "Invalid Date of Birth format."),
+    ("request_date", Validator.is_valid_date, "Invalid Request Date format."),
+    ("medicare_position", Validator.is_valid_medicare_position, "Invalid Medicare Position format."),
+)